@@ -5,29 +5,87 @@ A single-file web app to track unused packages on your system
 """
 
 import os
+import errno
+import re
 import sys
 import sqlite3
 import subprocess
 import json
-from datetime import datetime, timedelta
-from pathlib import Path
+import gzip
+import hashlib
+import queue
+import signal
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from datetime import datetime, timedelta, timezone
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 import threading
-import webbrowser
-import time
 
 # Configuration
 DB_PATH = os.path.expanduser("~/.dust_tracker.db")
 PORT = 8765
+LISTEN_BACKLOG = 1024  # the kernel caps this at net.core.somaxconn
+HANDLER_THREADS = 32  # requests served concurrently per process; the rest wait in the pool queue
+KEEPALIVE_TIMEOUT = 5  # seconds an idle keep-alive connection may hold a handler thread
+USAGE_RETENTION_DAYS = 30  # usage_events older than this are pruned after each process scan
+GZIP_MIN_SIZE = 1024  # JSON responses smaller than this are sent uncompressed
+PACMAN_LOCAL_DB = "/var/lib/pacman/local"  # mtime changes on every install/remove
+PACMAN_QO_CHUNK = 400  # paths per pacman -Qo call, keeps argv well under ARG_MAX
+
+# One line of pacman -Qo output: "<path> is owned by <package> <version>"
+PACMAN_OWNER_RE = re.compile(r'^(.+) is owned by (\S+) \S+$', re.MULTILINE)
+
+# pacman -Qi fields we keep, keyed by their label
+PACMAN_FIELDS = {
+    'Name': 'name',
+    'Description': 'description',
+    'Install Date': 'install_date',
+}
 
 class DustTracker:
     def __init__(self):
+        self._local = threading.local()
         self.init_db()
+        self._load_owner_cache()
+
+        # Background scans; a single queue slot coalesces bursts of scan requests
+        self._scan_q = queue.Queue(maxsize=1)
+        threading.Thread(target=self._scan_worker, daemon=True).start()
+
+    def _conn(self):
+        """Return this thread's database connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; writes are grouped explicitly via _transaction()
+            conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-20000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed statements in a single write transaction"""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
     def init_db(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = self._conn()
+        # WAL is persistent in the database file, so setting it once here is enough
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.execute('''
             CREATE TABLE IF NOT EXISTS packages (
                 name TEXT PRIMARY KEY,
@@ -47,156 +105,340 @@ class DustTracker:
                 FOREIGN KEY (package_name) REFERENCES packages (name)
             )
         ''')
-        conn.commit()
-        conn.close()
+
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_pkg_last_seen ON packages(last_seen)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_pkg_explicit_last ON packages(explicit_install, last_seen)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_usage_pkg_ts ON usage_events(package_name, timestamp)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_usage_ts ON usage_events(timestamp)')
+
+        # Cache of executable -> owning package (NULL if unowned), keyed by file mtime
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS file_pkg (
+                path TEXT PRIMARY KEY,
+                pkg TEXT,
+                mtime REAL
+            )
+        ''')
+
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value
+            )
+        ''')
+
+    def _load_owner_cache(self):
+        """Warm the in-memory file owner cache from the database"""
+        self._owner_cache_db_mtime = self._get_meta('file_pkg_db_mtime')
+        self._exe_to_pkg = {path: (pkg, mtime)
+                            for path, pkg, mtime in self._conn().execute('SELECT path, pkg, mtime FROM file_pkg')}
+
+    def _get_meta(self, key):
+        """Read a value from the meta table, or None if it was never set"""
+        row = self._conn().execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, conn, key, value):
+        """Store a value in the meta table as part of conn's transaction"""
+        conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def _pacman_db_mtime(self):
+        """mtime of pacman's local database directory, or None if unavailable"""
+        try:
+            return os.stat(PACMAN_LOCAL_DB).st_mtime
+        except OSError:
+            return None
+
+    def run_scan(self):
+        """Run a full package and process scan"""
+        pkg_result = self.scan_installed_packages()
+        proc_result = self.scan_running_processes()
+        return pkg_result and proc_result
+
+    def request_scan(self):
+        """Queue a background scan unless one is already waiting to run"""
+        try:
+            self._scan_q.put_nowait(None)
+        except queue.Full:
+            pass
+
+    @staticmethod
+    def scan_timestamp():
+        """Current time as fixed-width UTC ISO text, so scan times order as plain strings
+
+        UTC has no repeated hour when local time falls back from DST.
+        """
+        return datetime.now(timezone.utc).isoformat(timespec='microseconds')
+
+    @property
+    def scan_in_progress(self):
+        """True while a requested scan is queued or running"""
+        return self._scan_q.unfinished_tasks > 0
+
+    def _scan_worker(self):
+        """Run queued scans one at a time, off the HTTP request threads"""
+        while True:
+            self._scan_q.get()
+            try:
+                started = self.scan_timestamp()
+                try:
+                    success = self.run_scan()
+                except Exception as e:
+                    print(f"Error during background scan: {e}")
+                    success = False
+
+                # Stored in the database so every worker process reports the same result.
+                # Scans in different workers can overlap; one that started earlier but
+                # finished later must not move last_scan_ts backwards. Values without the
+                # UTC offset were written in local time by older versions; replace them
+                try:
+                    with self._transaction() as conn:
+                        last_scan_ts = self._get_meta('last_scan_ts')
+                        if (last_scan_ts is None or not last_scan_ts.endswith('+00:00')
+                                or last_scan_ts <= started):
+                            self._set_meta(conn, 'last_scan_ts', started)
+                            self._set_meta(conn, 'last_scan_success', success)
+                        self._bump_stats_version(conn)
+                except Exception as e:
+                    # Keep the worker alive; a dead one would leave every later scan queued forever
+                    print(f"Error recording scan result: {e}")
+            finally:
+                self._scan_q.task_done()
 
     def scan_installed_packages(self):
         """Scan all installed packages and update database"""
+        # The installed set only changes when pacman touches its database
+        db_mtime = self._pacman_db_mtime()
+        if db_mtime is not None and db_mtime == self._get_meta('installed_db_mtime'):
+            return True
+
         try:
-            # Get explicitly installed packages
-            explicit = subprocess.check_output(['pacman', '-Qqe']).decode().strip().split('\n')
-            explicit_set = set(explicit)
-
-            # Get all packages with info
-            all_packages = subprocess.check_output(['pacman', '-Qi']).decode()
-
-            conn = sqlite3.connect(DB_PATH)
-
-            current_pkg = {}
-            for line in all_packages.split('\n'):
-                if line.startswith('Name'):
-                    if current_pkg:
-                        self._save_package(conn, current_pkg, current_pkg['name'] in explicit_set)
-                    current_pkg = {'name': line.split(':', 1)[1].strip()}
-                elif line.startswith('Description'):
-                    current_pkg['description'] = line.split(':', 1)[1].strip()
-                elif line.startswith('Install Date'):
-                    current_pkg['install_date'] = line.split(':', 1)[1].strip()
-
-            if current_pkg:
-                self._save_package(conn, current_pkg, current_pkg['name'] in explicit_set)
-
-            conn.commit()
-            conn.close()
+            now = datetime.now().isoformat()
+
+            def collect(flag, is_explicit):
+                return [self._package_row(pkg, is_explicit, now)
+                        for pkg in self._iter_packages(['-Qi', flag])]
+
+            # Stream explicit and dependency packages from two concurrent pacman
+            # reads, tagging each one inline instead of checking a -Qqe list
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                explicit = pool.submit(collect, '--explicit', True)
+                deps = pool.submit(collect, '--deps', False)
+                rows = explicit.result() + deps.result()
+
+            with self._transaction() as conn:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO packages
+                    (name, description, install_date, explicit_install, last_seen)
+                    VALUES (?, ?, ?, ?, COALESCE((SELECT last_seen FROM packages WHERE name = ?), ?))
+                ''', rows)
+                self._set_meta(conn, 'installed_db_mtime', db_mtime)
+                self._bump_stats_version(conn)
             return True
 
         except subprocess.CalledProcessError as e:
             print(f"Error scanning packages: {e}")
             return False
 
-    def _save_package(self, conn, pkg_info, is_explicit):
-        """Save package info to database"""
-        now = datetime.now().isoformat()
-        conn.execute('''
-            INSERT OR REPLACE INTO packages
-            (name, description, install_date, explicit_install, last_seen)
-            VALUES (?, ?, ?, ?, COALESCE((SELECT last_seen FROM packages WHERE name = ?), ?))
-        ''', (
+    def _iter_packages(self, args):
+        """Stream pacman output line by line, yielding one dict per package"""
+        proc = subprocess.Popen(['pacman', *args], stdout=subprocess.PIPE,
+                                encoding='utf-8', bufsize=1)
+        current_pkg = {}
+        for line in proc.stdout:
+            key, _, value = line.partition(':')
+            field = PACMAN_FIELDS.get(key.rstrip())
+            if field is None:
+                continue
+            if field == 'name' and current_pkg:
+                yield current_pkg
+                current_pkg = {}
+            current_pkg[field] = value.strip()
+
+        if current_pkg:
+            yield current_pkg
+
+        proc.stdout.close()
+        if proc.wait():
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+    def _package_row(self, pkg_info, is_explicit, now):
+        """Build the packages row for a parsed pacman -Qi entry"""
+        return (
             pkg_info['name'],
             pkg_info.get('description', ''),
             pkg_info.get('install_date', ''),
             is_explicit,
             pkg_info['name'],
             now  # Default to "just installed/seen" instead of "Never"
-        ))
+        )
 
     def scan_running_processes(self):
         """Scan currently running processes and update last_seen"""
         try:
-            # Get all running processes
-            processes = []
-            for pid_dir in Path('/proc').iterdir():
-                if pid_dir.is_dir() and pid_dir.name.isdigit():
+            # Get the distinct executables (with their mtimes) of all running processes;
+            # numeric /proc entries are always PID directories, so no is_dir() is needed
+            processes = {}
+            with os.scandir('/proc') as entries:
+                for entry in entries:
+                    pid = entry.name
+                    if not pid[0].isdigit():
+                        continue
+                    exe_link = f'/proc/{pid}/exe'
+                    try:
+                        exe_path = os.readlink(exe_link)
+                    except (FileNotFoundError, PermissionError, ProcessLookupError):
+                        # Exited process, kernel thread, or another user's process
+                        continue
                     try:
-                        exe_path = (pid_dir / 'exe').readlink()
-                        processes.append(str(exe_path))
-                    except (OSError, PermissionError):
+                        mtime = os.stat(exe_link).st_mtime
+                    except OSError:
+                        # stat follows the link into the executable's filesystem, which
+                        # may be a dead FUSE or stale NFS mount; skip just this process
                         continue
+                    processes[exe_path] = mtime
 
-            # Map processes to packages
-            conn = sqlite3.connect(DB_PATH)
-            now = datetime.now().isoformat()
+            # Map processes to packages with as few pacman invocations as possible
+            exe_to_pkg = self._resolve_owners(processes)
 
+            scan_time = datetime.now()
+            now = scan_time.isoformat()
+            retention_cutoff = (scan_time - timedelta(days=USAGE_RETENTION_DAYS)).isoformat()
+            updates = []
+            events = []
             for exe_path in processes:
-                try:
-                    # Use pacman to find which package owns this file
-                    result = subprocess.check_output(['pacman', '-Qo', exe_path],
-                                                   stderr=subprocess.DEVNULL).decode()
-                    package_name = result.split()[4]  # Extract package name from output
-
-                    # Update last_seen
-                    conn.execute('''
-                        UPDATE packages SET last_seen = ? WHERE name = ?
-                    ''', (now, package_name))
-
-                    # Log usage event
-                    conn.execute('''
-                        INSERT INTO usage_events (package_name, event_type, timestamp)
-                        VALUES (?, ?, ?)
-                    ''', (package_name, 'process_scan', now))
-
-                except (subprocess.CalledProcessError, IndexError):
-                    continue
-
-            conn.commit()
-            conn.close()
+                package_name = exe_to_pkg.get(exe_path)
+                if package_name is not None:
+                    updates.append((now, package_name))
+                    events.append((package_name, 'process_scan', now))
+
+            with self._transaction() as conn:
+                # Update last_seen
+                conn.executemany('''
+                    UPDATE packages SET last_seen = ? WHERE name = ?
+                ''', updates)
+
+                # Log usage events
+                conn.executemany('''
+                    INSERT INTO usage_events (package_name, event_type, timestamp)
+                    VALUES (?, ?, ?)
+                ''', events)
+
+                # Keep the event log bounded; only last_seen is needed long term
+                conn.execute('DELETE FROM usage_events WHERE timestamp < ?', (retention_cutoff,))
+                self._bump_stats_version(conn)
             return True
 
         except Exception as e:
             print(f"Error scanning processes: {e}")
             return False
 
+    def _resolve_owners(self, exe_mtimes):
+        """Map executable paths to their owning packages (None if unowned)
+
+        Results are cached per (path, mtime), so pacman is only asked about
+        executables that are new or changed since they were last resolved.
+        """
+        self._check_owner_cache()
+
+        unknown = sorted(path for path, mtime in exe_mtimes.items()
+                         if self._exe_to_pkg.get(path, (None, None))[1] != mtime)
+        if unknown:
+            owners = self._query_owners(unknown)
+            entries = [(path, owners.get(path), exe_mtimes[path]) for path in unknown]
+            with self._transaction() as conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO file_pkg (path, pkg, mtime) VALUES (?, ?, ?)', entries)
+            for path, pkg, mtime in entries:
+                self._exe_to_pkg[path] = (pkg, mtime)
+
+        return {path: self._exe_to_pkg[path][0] for path in exe_mtimes}
+
+    def _check_owner_cache(self):
+        """Drop cached file owners if pacman's database changed since they were resolved"""
+        db_mtime = self._pacman_db_mtime()
+        if db_mtime == self._owner_cache_db_mtime:
+            return
+
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM file_pkg')
+            self._set_meta(conn, 'file_pkg_db_mtime', db_mtime)
+        self._exe_to_pkg = {}
+        self._owner_cache_db_mtime = db_mtime
+
+    def _query_owners(self, exe_paths):
+        """Look up the owning packages of exe_paths via batched pacman -Qo"""
+        exe_to_pkg = {}
+
+        for i in range(0, len(exe_paths), PACMAN_QO_CHUNK):
+            chunk = exe_paths[i:i + PACMAN_QO_CHUNK]
+            # pacman exits non-zero if any path is unowned, but still reports the rest
+            output = subprocess.run(['pacman', '-Qo', *chunk], stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL, encoding='utf-8').stdout
+            for match in PACMAN_OWNER_RE.finditer(output):
+                exe_to_pkg[match.group(1)] = match.group(2)
+
+        return exe_to_pkg
+
+    def _bump_stats_version(self, conn):
+        """Mark the stats as changed; called inside each scan's transaction"""
+        conn.execute('''
+            INSERT INTO meta (key, value) VALUES ('stats_version', 1)
+            ON CONFLICT (key) DO UPDATE SET value = value + 1
+        ''')
+
+    def stats_etag(self):
+        """Cheap fingerprint of get_package_stats() output, usable as an ETag
+
+        Combines the stats version bumped by every scan with the current hour,
+        since days_unused also advances with the clock when nothing is scanned,
+        and whether this process has a scan queued or running.
+        """
+        version = self._get_meta('stats_version') or 0
+        return f'W/"{version}-{datetime.now():%Y%m%d%H}-{int(self.scan_in_progress)}"'
+
     def get_package_stats(self):
         """Get package statistics for the web interface"""
-        conn = sqlite3.connect(DB_PATH)
+        conn = self._conn()
 
-        # Get packages with dust levels
+        # Get packages with dust levels; dust_percentage caps at 100% after 30 days
         cursor = conn.execute('''
-            SELECT name, description, install_date, explicit_install, last_seen,
+            WITH usage AS (
+                SELECT name, description, install_date, explicit_install, last_seen,
+                       CASE
+                           WHEN last_seen = 'Never' THEN 999
+                           ELSE CAST((julianday('now') - julianday(last_seen)) AS INTEGER)
+                       END as days_unused
+                FROM packages
+            )
+            SELECT name, description, install_date, explicit_install, last_seen, days_unused,
+                   MIN(days_unused * 100.0 / 30.0, 100.0) AS dust_percentage,
                    CASE
-                       WHEN last_seen = 'Never' THEN 999
-                       ELSE CAST((julianday('now') - julianday(last_seen)) AS INTEGER)
-                   END as days_unused
-            FROM packages
+                       WHEN explicit_install AND days_unused > 30 THEN 'safe'
+                       ELSE 'risky'
+                   END AS safety
+            FROM usage
             ORDER BY days_unused DESC, name
         ''')
 
-        packages = []
-        for row in cursor:
-            dust_level = min(row[5], 365)  # Cap at 365 days for visualization
-            dust_percentage = min((dust_level / 30.0) * 100, 100)  # 30 days = 100% dusty
-
-            packages.append({
-                'name': row[0],
-                'description': row[1],
-                'install_date': row[2],
-                'explicit_install': row[3],
-                'last_seen': row[4],
-                'days_unused': row[5],
-                'dust_percentage': dust_percentage,
-                'safety': 'safe' if row[3] and row[5] > 30 else 'risky'
-            })
-
-        # Get summary stats
-        cursor = conn.execute('SELECT COUNT(*) FROM packages')
-        total_packages = cursor.fetchone()[0]
-
-        # Count packages that haven't been seen in recent scans (truly unused)
-        cursor = conn.execute('''
-            SELECT COUNT(*) FROM packages
-            WHERE CAST((julianday('now') - julianday(last_seen)) AS INTEGER) > 7
-        ''')
-        unused_week = cursor.fetchone()[0]
+        cols = [d[0] for d in cursor.description]
+        packages = [dict(zip(cols, row)) for row in cursor]
 
-        cursor = conn.execute('''
-            SELECT COUNT(*) FROM packages
-            WHERE explicit_install = 1
-            AND CAST((julianday('now') - julianday(last_seen)) AS INTEGER) > 30
-            AND last_seen != 'Never'
-        ''')
-        dusty_explicit = cursor.fetchone()[0]
+        # Cutoffs are computed in the same isoformat as last_seen so the
+        # comparisons below can use the last_seen indexes
+        now = datetime.now()
+        week_ago = (now - timedelta(days=7)).isoformat()
+        month_ago = (now - timedelta(days=30)).isoformat()
 
-        conn.close()
+        # Get summary stats in one pass; "unused" means not seen in recent scans
+        cursor = conn.execute('''
+            SELECT COUNT(*),
+                   COALESCE(SUM(CASE WHEN last_seen < ? THEN 1 ELSE 0 END), 0),
+                   COALESCE(SUM(CASE WHEN explicit_install = 1 AND last_seen < ?
+                                      AND last_seen != 'Never' THEN 1 ELSE 0 END), 0)
+            FROM packages
+        ''', (week_ago, month_ago))
+        total_packages, unused_week, dusty_explicit = cursor.fetchone()
 
         return {
             'packages': packages,
@@ -204,11 +446,21 @@ class DustTracker:
                 'total': total_packages,
                 'unused_week': unused_week,
                 'dusty_explicit': dusty_explicit
-            }
+            },
+            'scan_in_progress': self.scan_in_progress,
+            'last_scan_ts': self._get_meta('last_scan_ts'),
+            'last_scan_success': bool(self._get_meta('last_scan_success'))
         }
 
 # Web server
 class DustHandler(BaseHTTPRequestHandler):
+    server_version = 'Dust'
+    # Keep-alive lets the dashboard's polls reuse one connection; every response
+    # carries a Content-Length so the client knows where it ends
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEPALIVE_TIMEOUT
+    disable_nagle_algorithm = True  # sets TCP_NODELAY so small responses go out immediately
+
     def __init__(self, *args, tracker=None, **kwargs):
         self.tracker = tracker
         super().__init__(*args, **kwargs)
@@ -220,38 +472,110 @@ class DustHandler(BaseHTTPRequestHandler):
         if path == '/':
             self._serve_html()
         elif path == '/api/stats':
-            self._serve_json(self.tracker.get_package_stats())
+            etag = self.tracker.stats_etag()
+            if self.headers.get('If-None-Match') == etag:
+                self._serve_not_modified(etag)
+            else:
+                self._serve_json(self.tracker.get_package_stats(), etag=etag)
         elif path == '/api/scan':
-            # Run scans
-            pkg_result = self.tracker.scan_installed_packages()
-            proc_result = self.tracker.scan_running_processes()
+            # Scans run on the tracker's worker thread; poll /api/stats for completion.
+            # Stamped before queueing so the scan that serves this request can't start earlier
+            queued_at = self.tracker.scan_timestamp()
+            self.tracker.request_scan()
             self._serve_json({
-                'success': pkg_result and proc_result,
-                'message': 'Scan completed',
-                'timestamp': datetime.now().isoformat()
-            })
+                'queued': True,
+                'message': 'Scan queued',
+                'timestamp': queued_at
+            }, status=202)
         else:
             self.send_error(404)
 
     def _serve_html(self):
-        """Serve the main HTML interface"""
-        html = HTML_TEMPLATE
+        """Serve the main HTML interface (pre-encoded and pre-compressed at import)"""
+        if self.headers.get('If-None-Match') == HTML_ETAG:
+            self._serve_not_modified(HTML_ETAG, HTML_CACHE_CONTROL)
+            return
+        gzipped = self._accepts_gzip()
         self.send_response(200)
-        self.send_header('Content-type', 'text/html')
+        self.send_header('Content-type', 'text/html; charset=utf-8')
+        self.send_header('Cache-Control', HTML_CACHE_CONTROL)
+        self.send_header('ETag', HTML_ETAG)
+        self._send_body(HTML_GZ if gzipped else HTML_BYTES, gzipped)
+
+    def _serve_json(self, data, etag=None, status=200):
+        """Serve JSON response, revalidated by ETag on every use if one is given"""
+        body = json.dumps(data, separators=(',', ':')).encode()
+        gzipped = len(body) >= GZIP_MIN_SIZE and self._accepts_gzip()
+        if gzipped:
+            body = gzip.compress(body, 6)
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        self._send_body(body, gzipped)
+
+    def _serve_not_modified(self, etag, cache_control='no-cache'):
+        """Tell the client its cached copy is still current"""
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', cache_control)
         self.end_headers()
-        self.wfile.write(html.encode())
 
-    def _serve_json(self, data):
-        """Serve JSON response"""
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
+    def _accepts_gzip(self):
+        """Check whether the client accepts gzip-encoded responses"""
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
+
+    def _send_body(self, body, gzipped):
+        """Finish the headers and write body, which is already compressed if gzipped"""
+        if gzipped:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
 
     def log_message(self, format, *args):
         """Suppress server logs"""
         pass
 
+class DustHTTPServer(HTTPServer):
+    """Thread-pooled HTTP server whose port can be shared by several worker processes"""
+
+    request_queue_size = LISTEN_BACKLOG
+
+    def __init__(self, server_address, handler_class, reuse_port=False, backlog=LISTEN_BACKLOG):
+        self.reuse_port = reuse_port
+        self.request_queue_size = backlog
+        # A bounded pool instead of a new thread per connection. Created first:
+        # a failed bind calls server_close() from inside super().__init__()
+        self._pool = ThreadPoolExecutor(HANDLER_THREADS, thread_name_prefix='dust')
+        super().__init__(server_address, handler_class)
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False)
+
+    def server_bind(self):
+        if self.reuse_port:
+            # Every worker binds its own socket; the kernel balances connections across them
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        if hasattr(socket, 'TCP_DEFER_ACCEPT'):
+            # Linux: only wake accept() once the request data has arrived
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_DEFER_ACCEPT, 1)
+        super().server_bind()
+
 # HTML Template (embedded in the Python file)
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
@@ -484,6 +808,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         let currentFilter = 'all';
         let autoScanInterval;
         let scanCounter = 0;
+        const SCAN_POLL_LIMIT = 300; // seconds to wait for a queued scan before giving up
 
         // Load settings from localStorage
         function loadSettings() {
@@ -536,16 +861,28 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             }
 
             try {
-                const response = await fetch('/api/scan');
-                const result = await response.json();
+                const queued = await (await fetch('/api/scan')).json();
+
+                // The scan runs in the background; poll until one that started
+                // after our request has finished (timestamps share the server clock)
+                let data;
+                let polls = 0;
+                do {
+                    if (++polls > SCAN_POLL_LIMIT) {
+                        throw new Error('Timed out waiting for the scan to finish');
+                    }
+                    await new Promise(resolve => setTimeout(resolve, 1000));
+                    const response = await fetch('/api/stats');
+                    data = await response.json();
+                } while (!(data.last_scan_ts >= queued.timestamp));
 
                 // Save last scan time
                 const settings = loadSettings();
-                settings.lastScanTime = result.timestamp || new Date().toISOString();
+                settings.lastScanTime = data.last_scan_ts || new Date().toISOString();
                 saveSettings(settings);
                 updateLastScanDisplay(settings.lastScanTime);
 
-                if (result.success) {
+                if (data.last_scan_success) {
                     if (!silent) {
                         btn.textContent = '✅ Scan Complete';
                         setTimeout(() => {
@@ -553,7 +890,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                             btn.disabled = false;
                         }, 2000);
                     }
-                    loadData();
+                    showData(data);
                 } else {
                     if (!silent) {
                         btn.textContent = '❌ Scan Failed';
@@ -598,17 +935,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
         async function loadData() {
             try {
                 const response = await fetch('/api/stats');
-                const data = await response.json();
-
-                // Update stats
-                document.getElementById('total-packages').textContent = data.stats.total;
-                document.getElementById('unused-week').textContent = data.stats.unused_week;
-                document.getElementById('dusty-explicit').textContent = data.stats.dusty_explicit;
-
-                // Store packages and render
-                allPackages = data.packages;
-                renderPackages();
-
+                showData(await response.json());
             } catch (error) {
                 console.error('Failed to load data:', error);
                 document.getElementById('package-list').innerHTML =
@@ -616,6 +943,17 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
             }
         }
 
+        function showData(data) {
+            // Update stats
+            document.getElementById('total-packages').textContent = data.stats.total;
+            document.getElementById('unused-week').textContent = data.stats.unused_week;
+            document.getElementById('dusty-explicit').textContent = data.stats.dusty_explicit;
+
+            // Store packages and render
+            allPackages = data.packages;
+            renderPackages();
+        }
+
         function renderPackages() {
             const filtered = filterPackagesList(allPackages, currentFilter);
             const html = filtered.map(pkg => {
@@ -708,6 +1046,12 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 </body>
 </html>'''
 
+# The page never changes at runtime, so encode and compress it once
+HTML_BYTES = HTML_TEMPLATE.encode('utf-8')
+HTML_GZ = gzip.compress(HTML_BYTES, 9)
+HTML_ETAG = f'W/"{hashlib.blake2b(HTML_BYTES, digest_size=8).hexdigest()}"'
+HTML_CACHE_CONTROL = 'max-age=60, public'
+
 def create_systemd_service():
     """Create systemd user service for background operation"""
     script_path = os.path.abspath(__file__)
@@ -756,31 +1100,47 @@ WantedBy=default.target
 
     return True
 
-def find_free_port(start_port=8765, max_attempts=10):
-    """Find a free port starting from start_port"""
-    import socket
+def open_browser(url):
+    """Hand url to the default browser without waiting for it
 
-    for port in range(start_port, start_port + max_attempts):
+    Returns the opener process for the caller to reap, or None if webbrowser handled it.
+    """
+    opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+    try:
+        return subprocess.Popen([opener, url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        # No xdg-utils (common on minimal installs); webbrowser honours $BROWSER
+        # and tries the usual browsers itself, so only load it when needed
+        import webbrowser
+        if not webbrowser.open(url):
+            raise OSError(f"no browser found for {url}")
+        return None
+
+def bind_server(handler, reuse_port=False, backlog=LISTEN_BACKLOG, max_attempts=32):
+    """Bind a server on the first free port from PORT onwards, or return None"""
+
+    for port in range(PORT, PORT + max_attempts):
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('localhost', port))
-                return port
-        except OSError:
-            continue
+            return DustHTTPServer(('localhost', port), handler, reuse_port, backlog)
+        except OSError as e:
+            if e.errno != errno.EADDRINUSE:
+                raise
     return None
 
 def check_if_running(port=PORT):
     """Check if Dust is already running on the given port"""
-    import socket
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.connect(('localhost', port))
-            # Try to make a simple request to confirm it's actually Dust
-            s.send(b'GET / HTTP/1.1\r\nHost: localhost\r\n\r\n')
-            response = s.recv(1024).decode()
-            return 'Dust' in response
-    except:
+            s.settimeout(0.5)
+            if s.connect_ex(('localhost', port)) != 0:
+                return False
+            # Something is listening; confirm it's Dust from the Server header alone
+            s.sendall(b'HEAD / HTTP/1.0\r\n\r\n')
+            return b'\r\nServer: Dust' in s.recv(512)
+    except OSError:
         return False
+
+def print_help():
     """Print usage help"""
     script_name = os.path.basename(__file__)
     print(f"""
@@ -789,6 +1149,8 @@ def check_if_running(port=PORT):
 USAGE:
     {script_name}                    # Start web interface (default)
     {script_name} --headless         # Run as background service (no browser)
+    {script_name} --workers N        # Serve with N processes sharing the port
+    {script_name} --backlog N        # Listen queue length (default {LISTEN_BACKLOG})
     {script_name} --scan-only        # Run single scan and exit
     {script_name} --install-service  # Create systemd user service
     {script_name} --help             # Show this help
@@ -805,6 +1167,9 @@ SERVICE MODE:
     • Starts automatically on login
     • Manage with: systemctl --user <start|stop|status> dust_tracker.service
 
+ENVIRONMENT:
+    • DUST_CPU=N pins the server to CPU N (each extra worker takes the next CPU)
+
 DATABASE:
     • Location: {DB_PATH}
     • SQLite format, portable
@@ -816,12 +1181,48 @@ EXAMPLES:
     systemctl --user start dust_tracker.service  # Start service
     """)
 
+def pop_int_option(args, name, default):
+    """Remove "<name> N" from args and return N, or default if the option is absent"""
+    if name not in args:
+        return default
+    i = args.index(name)
+    value = args[i + 1] if i + 1 < len(args) else ''
+    del args[i:i + 2]
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f"{name} expects a positive number, got '{value}'")
+    return int(value)
+
+def pin_to_cpu(first_cpu, worker_index=0):
+    """Pin this process to one CPU, giving each worker the next allowed CPU after first_cpu"""
+    if first_cpu is None or not hasattr(os, 'sched_setaffinity'):
+        return
+    cpus = sorted(os.sched_getaffinity(0))
+    start = cpus.index(first_cpu)  # main() has checked that first_cpu is allowed
+    os.sched_setaffinity(0, {cpus[(start + worker_index) % len(cpus)]})
+
 def main():
     # Set environment to suppress DRI_PRIME warning
     os.environ.setdefault('DRI_PRIME', '1')
 
-    if len(sys.argv) > 1:
-        arg = sys.argv[1]
+    args = sys.argv[1:]
+    try:
+        workers = pop_int_option(args, '--workers', 1)
+        backlog = pop_int_option(args, '--backlog', LISTEN_BACKLOG)
+        # Opt-in: pinning only pays off on an otherwise quiet machine
+        first_cpu = os.environ.get('DUST_CPU')
+        if first_cpu is not None:
+            if not first_cpu.isdigit():
+                raise ValueError(f"DUST_CPU expects a CPU number, got '{first_cpu}'")
+            first_cpu = int(first_cpu)
+            if hasattr(os, 'sched_getaffinity') and first_cpu not in os.sched_getaffinity(0):
+                allowed = ','.join(map(str, sorted(os.sched_getaffinity(0))))
+                raise ValueError(f"DUST_CPU={first_cpu} is not an allowed CPU (allowed: {allowed})")
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    if args:
+        arg = args[0]
 
         if arg == '--help' or arg == '-h':
             print_help()
@@ -863,67 +1264,103 @@ def main():
         headless_mode = False
 
     # Web server mode
-    tracker = DustTracker()
-
     # Check if already running
     if check_if_running(PORT):
         print(f"🧹 Dust Tracker is already running on http://localhost:{PORT}")
         if not headless_mode:
             print("🌐 Opening existing instance in browser...")
             try:
-                webbrowser.open(f'http://localhost:{PORT}')
-            except Exception as e:
+                open_browser(f'http://localhost:{PORT}')
+            except OSError:
                 print(f"   Manual access: http://localhost:{PORT}")
         else:
             print("   Already running in headless mode")
         return
 
-    # Try to find a free port if default is taken
-    actual_port = PORT
-    try:
-        server = HTTPServer(('localhost', PORT), lambda *args, **kwargs: DustHandler(*args, tracker=tracker, **kwargs))
-    except OSError as e:
-        if "Address already in use" in str(e):
-            print(f"⚠️  Port {PORT} is busy, finding alternative...")
-            actual_port = find_free_port(PORT + 1)
-            if actual_port is None:
-                print("❌ No free ports available. Try stopping other services.")
-                return
-            print(f"🔄 Using port {actual_port} instead")
-            server = HTTPServer(('localhost', actual_port), lambda *args, **kwargs: DustHandler(*args, tracker=tracker, **kwargs))
-        else:
-            raise
+    # The tracker starts a scan thread, so it is only created after any worker
+    # processes are forked; the handler gets bound to it once it exists
+    reuse_port = workers > 1
 
-    print(f"🧹 Dust Tracker starting on http://localhost:{actual_port}")
+    # Take the first free port if default is taken
+    server = bind_server(DustHandler, reuse_port, backlog)
+    if server is None:
+        print("❌ No free ports available. Try stopping other services.")
+        return
+    actual_port = server.server_address[1]
+
+    # Startup messages are written in one go (a single write to journald under systemd)
+    lines = []
+    if actual_port != PORT:
+        lines.append(f"⚠️  Port {PORT} is busy, using port {actual_port} instead")
+
+    # Extra worker processes each serve their own SO_REUSEPORT socket on the same port
+    children = []
+    for worker_index in range(1, workers):
+        pid = os.fork()
+        if pid == 0:
+            pin_to_cpu(first_cpu, worker_index)
+            server.server_close()
+            handler = partial(DustHandler, tracker=DustTracker())
+            server = DustHTTPServer(('localhost', actual_port), handler, reuse_port, backlog)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            os._exit(0)
+        children.append(pid)
+
+    pin_to_cpu(first_cpu)
+    server.RequestHandlerClass = partial(DustHandler, tracker=DustTracker())
+
+    lines.append(f"🧹 Dust Tracker starting on http://localhost:{actual_port}")
+    if children:
+        lines.append(f"⚙️  Serving with {workers} worker processes")
+        # Let `systemctl stop` run the cleanup below instead of orphaning the workers
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     if headless_mode:
-        print("🔇 Running in headless mode (no browser window)")
-        print(f"   Access via: http://localhost:{actual_port}")
-        print("   Stop with: systemctl --user stop dust_tracker.service")
-        print("   Or kill this process")
+        lines += [
+            "🔇 Running in headless mode (no browser window)",
+            f"   Access via: http://localhost:{actual_port}",
+            "   Stop with: systemctl --user stop dust_tracker.service",
+            "   Or kill this process",
+        ]
     else:
-        print("🌐 Opening browser...")
-        print("💡 Tip: Pin this tab and let it run for continuous monitoring")
-
-        # Open browser after a short delay
-        def open_browser():
-            time.sleep(1.5)
+        lines += [
+            "🌐 Opening browser...",
+            "💡 Tip: Pin this tab and let it run for continuous monitoring",
+        ]
+    lines.append("Press Ctrl+C to stop")
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+    if not headless_mode:
+        # The socket is already listening, so the browser's first request just
+        # waits in the accept queue until serve_forever() picks it up
+        def launch_browser():
             try:
-                webbrowser.open(f'http://localhost:{actual_port}')
-            except Exception as e:
+                opener = open_browser(f'http://localhost:{actual_port}')
+            except OSError as e:
                 print(f"⚠️  Couldn't open browser automatically: {e}")
                 print(f"   Please open: http://localhost:{actual_port}")
+                return
+            if opener:
+                opener.wait()  # reap it so it doesn't linger as a zombie
 
-        browser_thread = threading.Thread(target=open_browser)
-        browser_thread.daemon = True
-        browser_thread.start()
-
-    print("Press Ctrl+C to stop")
+        threading.Thread(target=launch_browser, daemon=True).start()
 
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\n👋 Shutting down...")
         server.shutdown()
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            os.waitpid(pid, 0)
 
 if __name__ == '__main__':
     main()
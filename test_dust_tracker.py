@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Regression checks for Dust Tracker
+Run with: python -m unittest test_dust_tracker
+"""
+
+import errno
+import io
+import json
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import unittest
+import urllib.request
+import webbrowser
+from unittest import mock
+
+import dust_tracker
+from contextlib import redirect_stdout
+from functools import partial
+from dust_tracker import DustHandler, DustHTTPServer, DustTracker, bind_server, open_browser
+
+
+class BindServerTest(unittest.TestCase):
+
+    def test_busy_port_falls_back_to_next_port(self):
+        """A port held by another program moves bind_server on instead of crashing"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as busy:
+            busy.bind(('localhost', 0))
+            busy.listen()
+            busy_port = busy.getsockname()[1]
+
+            original_port = dust_tracker.PORT
+            dust_tracker.PORT = busy_port
+            try:
+                server = bind_server(DustHandler)
+            finally:
+                dust_tracker.PORT = original_port
+
+            self.assertIsNotNone(server)
+            try:
+                self.assertNotEqual(server.server_address[1], busy_port)
+            finally:
+                server.server_close()
+
+    def test_failed_bind_raises_oserror(self):
+        """The bind error itself reaches the caller, not a cleanup error"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as busy:
+            busy.bind(('localhost', 0))
+            busy.listen()
+            with self.assertRaises(OSError):
+                DustHTTPServer(busy.getsockname(), DustHandler)
+
+
+class OpenBrowserTest(unittest.TestCase):
+
+    def test_missing_opener_falls_back_to_webbrowser(self):
+        """Without xdg-open the URL still reaches a browser through webbrowser"""
+        with mock.patch('subprocess.Popen', side_effect=FileNotFoundError), \
+                mock.patch.object(webbrowser, 'open', return_value=True) as wb_open:
+            self.assertIsNone(open_browser('http://localhost:8765'))
+        wb_open.assert_called_once_with('http://localhost:8765')
+
+    def test_no_browser_at_all_raises_oserror(self):
+        """Callers print the manual-access hint on OSError"""
+        with mock.patch('subprocess.Popen', side_effect=FileNotFoundError), \
+                mock.patch.object(webbrowser, 'open', return_value=False):
+            with self.assertRaises(OSError):
+                open_browser('http://localhost:8765')
+
+
+class GatedTracker(DustTracker):
+    """Tracker whose scans block until the test releases them"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        super().__init__()
+
+    def run_scan(self):
+        self.started.set()
+        self.release.wait(5)
+        return True
+
+
+class OverlappingScanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.original_db_path = dust_tracker.DB_PATH
+        dust_tracker.DB_PATH = os.path.join(self.tmpdir.name, 'dust.db')
+
+    def tearDown(self):
+        dust_tracker.DB_PATH = self.original_db_path
+        self.tmpdir.cleanup()
+
+    def test_older_scan_finishing_last_keeps_newest_timestamp(self):
+        """Two worker processes' scans overlap; last_scan_ts must never go backwards"""
+        first, second = GatedTracker(), GatedTracker()
+
+        first.request_scan()
+        self.assertTrue(first.started.wait(5))
+        second.request_scan()
+        self.assertTrue(second.started.wait(5))
+        second.release.set()
+        second._scan_q.join()
+        newest = second._get_meta('last_scan_ts')
+
+        first.release.set()
+        first._scan_q.join()
+        self.assertEqual(first._get_meta('last_scan_ts'), newest)
+
+    def test_failed_result_write_keeps_worker_alive(self):
+        """A locked database while recording a scan must not stop later scans"""
+        tracker = GatedTracker()
+        tracker.release.set()
+        set_meta = tracker._set_meta
+        failures = [sqlite3.OperationalError('database is locked')]
+
+        def flaky_set_meta(conn, key, value):
+            if failures:
+                raise failures.pop()
+            set_meta(conn, key, value)
+
+        tracker._set_meta = flaky_set_meta
+        with redirect_stdout(io.StringIO()) as out:
+            tracker.request_scan()
+            tracker._scan_q.join()
+        self.assertIn('database is locked', out.getvalue())
+        self.assertIsNone(tracker._get_meta('last_scan_ts'))
+
+        tracker.started.clear()
+        tracker.request_scan()
+        self.assertTrue(tracker.started.wait(5))
+        tracker._scan_q.join()
+        self.assertFalse(tracker.scan_in_progress)
+        self.assertIsNotNone(tracker._get_meta('last_scan_ts'))
+
+    def test_local_time_scan_ts_from_older_versions_is_replaced(self):
+        """A naive local timestamp can sort after UTC ones; it must not block updates"""
+        tracker = GatedTracker()
+        tracker.release.set()
+        with tracker._transaction() as conn:
+            tracker._set_meta(conn, 'last_scan_ts', '9999-12-31T23:59:59.999999')
+            tracker._set_meta(conn, 'last_scan_success', False)
+
+        tracker.request_scan()
+        tracker._scan_q.join()
+        self.assertTrue(tracker._get_meta('last_scan_ts').endswith('+00:00'))
+        self.assertEqual(tracker._get_meta('last_scan_success'), True)
+
+    def test_scan_request_timestamp_precedes_queueing(self):
+        """The scan serving a request must not appear to have started before it"""
+        tracker = GatedTracker()
+        tracker.release.set()
+        queued_at = []
+        request_scan = tracker.request_scan
+
+        def recording_request_scan():
+            queued_at.append(tracker.scan_timestamp())
+            request_scan()
+
+        tracker.request_scan = recording_request_scan
+        server = DustHTTPServer(('localhost', 0), partial(DustHandler, tracker=tracker))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f'http://localhost:{server.server_address[1]}'
+            with urllib.request.urlopen(f'{url}/api/scan') as response:
+                queued = json.load(response)
+            tracker._scan_q.join()
+            with urllib.request.urlopen(f'{url}/api/stats') as response:
+                stats = json.load(response)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertLessEqual(queued['timestamp'], queued_at[0])
+        self.assertGreaterEqual(stats['last_scan_ts'], queued['timestamp'])
+
+
+class ProcessScanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.original_db_path = dust_tracker.DB_PATH
+        dust_tracker.DB_PATH = os.path.join(self.tmpdir.name, 'dust.db')
+
+    def tearDown(self):
+        dust_tracker.DB_PATH = self.original_db_path
+        self.tmpdir.cleanup()
+
+    def test_unreachable_executable_skips_only_that_process(self):
+        """stat() on a binary behind a dead mount must not abort the whole scan"""
+        tracker = DustTracker()
+        dead_link = f'/proc/{os.getpid()}/exe'
+        real_stat = os.stat
+
+        def stat(path, *args, **kwargs):
+            if path == dead_link:
+                raise OSError(errno.ENOTCONN, os.strerror(errno.ENOTCONN), path)
+            return real_stat(path, *args, **kwargs)
+
+        tracker._resolve_owners = lambda exe_mtimes: {}
+        with mock.patch.object(dust_tracker.os, 'stat', side_effect=stat):
+            self.assertTrue(tracker.scan_running_processes())
+
+
+class CpuPinningTest(unittest.TestCase):
+
+    def test_cpu_outside_allowed_set_is_rejected(self):
+        """DUST_CPU naming a CPU this process can't use fails instead of pinning elsewhere"""
+        if not hasattr(os, 'sched_getaffinity'):
+            self.skipTest('CPU affinity is not supported on this platform')
+        outside = max(os.sched_getaffinity(0)) + 1
+        with mock.patch.dict(os.environ, {'DUST_CPU': str(outside)}), \
+                mock.patch.object(dust_tracker.sys, 'argv', ['dust_tracker.py', '--headless']), \
+                mock.patch.object(dust_tracker, 'bind_server') as bind, \
+                redirect_stdout(io.StringIO()) as out:
+            dust_tracker.main()
+        self.assertIn(f'DUST_CPU={outside} is not an allowed CPU', out.getvalue())
+        bind.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()